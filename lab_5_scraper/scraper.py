@@ -1,25 +1,59 @@
 """
 Crawler implementation.
 """
+import asyncio
 import datetime
+import functools
 
 # pylint: disable=too-many-arguments, too-many-instance-attributes, unused-import, undefined-variable, unused-argument
 import json
+import multiprocessing
+import os
 import pathlib
 import shutil
 import time
 import urllib.parse
-from random import randint
-from typing import Pattern, Union
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional, Pattern, Union
 
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from aiolimiter import AsyncLimiter
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree, html
 
 import core_utils.article.io as article_io
 from core_utils.article.article import Article
 from core_utils.config_dto import ConfigDTO
 from core_utils.constants import ASSETS_PATH, CRAWLER_CONFIG_PATH
 
+#: Prefixes every seed url must start with
+SEED_URL_PREFIXES = ('http://vzm-vesti.ru/', 'https://vzm-vesti.ru/')
+
+#: Maximum number of requests in flight at the same time
+MAX_CONCURRENT_REQUESTS = 64
+
+#: Number of seconds between two requests to the same host
+HOST_REQUEST_INTERVAL = 2
+
+#: Maximum number of repeated requests after a retryable status
+MAX_RETRIES = 3
+
+#: Maximum number of seconds to wait before repeating a request
+MAX_RETRY_DELAY = 60
+
+#: Response statuses worth repeating the request after a pause
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+#: Errors that make a single page be skipped instead of stopping the run
+PAGE_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, etree.LxmlError)
+
+#: Ports implied by url schemes
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+_last_request_time: dict[str, float] = {}
+
 
 class IncorrectEncodingError(Exception):
     """Incorrect Encoding Error"""
@@ -49,11 +83,52 @@ class NumberOfArticlesOutOfRangeError(Exception):
     """Number Of Articles Out Of Range Error"""
 
 
+def canonicalize_url(url: str) -> str:
+    """
+    Bring absolute url to a single canonical form.
+
+    Scheme and host are lowercased, default port and fragment are dropped,
+    query parameters are sorted without being re-encoded, user info is kept.
+
+    Args:
+        url (str): Absolute url
+
+    Returns:
+        str: Canonical url
+
+    Raises:
+        ValueError: If url port is malformed
+    """
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.hostname or ''
+    if ':' in netloc:
+        netloc = f'[{netloc}]'
+    if parts.port is not None and parts.port != DEFAULT_PORTS.get(scheme):
+        netloc = f'{netloc}:{parts.port}'
+    if '@' in parts.netloc:
+        netloc = f"{parts.netloc.rpartition('@')[0]}@{netloc}"
+    query = '&'.join(sorted(parts.query.split('&')))
+    return urllib.parse.urlunsplit((scheme, netloc, parts.path or '/', query, ''))
+
+
 class Config:
     """
     Class for unpacking and validating configurations.
     """
 
+    __slots__ = (
+        "path_to_config",
+        "_seed_urls",
+        "_num_articles",
+        "_headers",
+        "_encoding",
+        "_timeout",
+        "_should_verify_certificate",
+        "_headless_mode",
+        "request_kwargs",
+    )
+
     def __init__(self, path_to_config: pathlib.Path) -> None:
         """
         Initialize an instance of the Config class.
@@ -71,6 +146,11 @@ class Config:
         self._should_verify_certificate = config.should_verify_certificate
         self._headless_mode = config.headless_mode
         self._validate_config_content()
+        self.request_kwargs: dict[str, Any] = {
+            "headers": self._headers,
+            "timeout": self._timeout,
+            "verify": self._should_verify_certificate,
+        }
 
     def _extract_config_content(self) -> ConfigDTO:
         """
@@ -97,9 +177,9 @@ class Config:
         """
         if not isinstance(self._seed_urls, list):
             raise IncorrectSeedURLError('incorrect url')
-        for url in self._seed_urls:
-            if not isinstance(url, str) or 'http://vzm-vesti.ru/' not in url:
-                raise IncorrectSeedURLError('incorrect url')
+        if not all(isinstance(url, str) and url.startswith(SEED_URL_PREFIXES)
+                   for url in self._seed_urls):
+            raise IncorrectSeedURLError('incorrect url')
         if not isinstance(self._num_articles, int) or self._num_articles <= 0:
             raise IncorrectNumberOfArticlesError('number is not int or less that 0')
         if self._num_articles < 0 or self._num_articles > 150:
@@ -178,6 +258,47 @@ class Config:
         return self._headless_mode
 
 
+@functools.cache
+def get_session() -> requests.Session:
+    """
+    Retrieve HTTP session reused by all synchronous requests.
+
+    Returns:
+        requests.Session: Session keeping connections alive between requests
+    """
+    return requests.Session()
+
+
+def _wait_for_host(url: str) -> None:
+    """
+    Pause until the host of url may be requested again.
+
+    Args:
+        url (str): Site url
+    """
+    host = urllib.parse.urlsplit(url).netloc
+    delay = _last_request_time.get(host, 0.0) + HOST_REQUEST_INTERVAL - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    _last_request_time[host] = time.monotonic()
+
+
+def _get_retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """
+    Compute number of seconds to wait before repeating a request, at most MAX_RETRY_DELAY.
+
+    Args:
+        retry_after (Optional[str]): Value of Retry-After header
+        attempt (int): Number of the failed attempt, starting from 0
+
+    Returns:
+        float: Number of seconds to wait
+    """
+    if retry_after is not None and retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_DELAY)
+    return min(float(HOST_REQUEST_INTERVAL * 2 ** attempt), MAX_RETRY_DELAY)
+
+
 def make_request(url: str, config: Config) -> requests.models.Response:
     """
     Deliver a response from a request with given configuration.
@@ -189,14 +310,56 @@ def make_request(url: str, config: Config) -> requests.models.Response:
     Returns:
         requests.models.Response: A response from a request
     """
-    time.sleep(randint(1, 5))
-    site_request = requests.get(url=url,
-                                headers=config.get_headers(),
-                                timeout=config.get_timeout(),
-                                verify=config.get_verify_certificate())
+    for attempt in range(MAX_RETRIES + 1):
+        _wait_for_host(url)
+        site_request = get_session().get(url=url, **config.request_kwargs)
+        if site_request.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            break
+        time.sleep(_get_retry_delay(site_request.headers.get('Retry-After'), attempt))
+    site_request.encoding = config.get_encoding()
     return site_request
 
 
+async def fetch(
+    session: aiohttp.ClientSession,
+    url: str,
+    semaphore: asyncio.Semaphore,
+    limiters: defaultdict[str, AsyncLimiter],
+) -> bytes:
+    """
+    Asynchronously deliver a raw page content.
+
+    Args:
+        session (aiohttp.ClientSession): Client session shared by the whole run,
+            already carrying configured headers and timeout
+        url (str): Site url
+        semaphore (asyncio.Semaphore): Semaphore bounding requests in flight
+        limiters (defaultdict[str, AsyncLimiter]): Rate limiters keyed by host
+
+    Returns:
+        bytes: Raw page content
+    """
+    limiter = limiters[urllib.parse.urlsplit(url).netloc]
+    for attempt in range(MAX_RETRIES + 1):
+        async with semaphore, limiter, session.get(url) as response:
+            content = await response.read()
+            if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+            delay = _get_retry_delay(response.headers.get('Retry-After'), attempt)
+        await asyncio.sleep(delay)
+    return content
+
+
+def _create_host_limiters() -> defaultdict[str, AsyncLimiter]:
+    """
+    Create rate limiters allowing one request per host every HOST_REQUEST_INTERVAL seconds.
+
+    Returns:
+        defaultdict[str, AsyncLimiter]: Rate limiters keyed by host
+    """
+    return defaultdict(lambda: AsyncLimiter(max_rate=1, time_period=HOST_REQUEST_INTERVAL))
+
+
 class Crawler:
     """
     Crawler implementation.
@@ -205,6 +368,9 @@ class Crawler:
     #: Url pattern
     url_pattern: Union[Pattern, str]
 
+    #: Strainer limiting seed page parsing to article headers
+    url_strainer = SoupStrainer('h2', class_='post-title entry-title')
+
     def __init__(self, config: Config) -> None:
         """
         Initialize an instance of the Crawler class.
@@ -214,6 +380,7 @@ class Crawler:
         """
         self.config = config
         self.urls = []
+        self._seen: set[str] = set()
 
     def _extract_url(self, article_bs: BeautifulSoup) -> list:
         """
@@ -227,11 +394,13 @@ class Crawler:
         """
         url_list = []
         h2_articles = article_bs.find('h2', class_='post-title entry-title')
+        if h2_articles is None:
+            return url_list
         # print(h2_articles.find('a'))
         for link in h2_articles.find_all('a'):
             # print(link.get('href'))
-            link.get('href')
-            url_list.append(link.get('href'))
+            if link.get('href'):
+                url_list.append(link.get('href'))
         # for elem in h2_articles:
             # print(elem)
 
@@ -246,23 +415,43 @@ class Crawler:
         # print(url_list)
         return url_list
 
+    def collect_urls(self, seed_url: str, page: bytes) -> list[str]:
+        """
+        Add article urls found on downloaded seed page.
+
+        Args:
+            seed_url (str): Seed url the page was downloaded from
+            page (bytes): Raw seed page content
+
+        Returns:
+            list[str]: Urls newly added to urls field
+        """
+        soup = BeautifulSoup(page, 'lxml', parse_only=self.url_strainer,
+                             from_encoding=self.config.get_encoding())
+        new_urls = []
+        for href in self._extract_url(soup):
+            if len(self.urls) >= self.config.get_num_articles():
+                break
+            try:
+                url = canonicalize_url(urllib.parse.urljoin(seed_url, href))
+            except ValueError:
+                continue
+            if url not in self._seen:
+                self._seen.add(url)
+                self.urls.append(url)
+                new_urls.append(url)
+        return new_urls
+
     def find_articles(self) -> None:
         """
         Find articles.
         """
         seed_urls = self.config.get_seed_urls()
         for seed_url in seed_urls:
+            if len(self.urls) >= self.config.get_num_articles():
+                return None
             response = make_request(seed_url, self.config)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            url_list = self._extract_url(soup)
-            if len(url_list) != 0:
-                for url in url_list:
-                    # absolute_url = urllib.parse.urljoin(seed_url, url)
-                    # print(absolute_url)
-                    if url not in self.urls:
-                        self.urls.append(url)
-                    if len(self.urls) >= self.config.get_num_articles():
-                        return None
+            self.collect_urls(seed_url, response.content)
 
     def get_search_urls(self) -> list:
         """
@@ -297,44 +486,32 @@ class HTMLParser:
         self.config = config
         self.article = Article(self._full_url, self._article_id)
 
-    def _fill_article_with_text(self, article_soup: BeautifulSoup) -> None:
+    def _fill_article_with_text(self, article_tree: html.HtmlElement) -> None:
         """
         Find text of article.
 
         Args:
-            article_soup (bs4.BeautifulSoup): BeautifulSoup instance
+            article_tree (html.HtmlElement): Root of lxml HTML tree
         """
-        all_body = article_soup.find_all("p")
-
-        for p in all_body:
-            self.article.text += p.text
+        self.article.text = "".join(article_tree.xpath("//p//text()"))
 
-    def _fill_article_with_meta_information(self, article_soup: BeautifulSoup) -> None:
+    def _fill_article_with_meta_information(self, article_tree: html.HtmlElement) -> None:
         """
         Find meta information of article.
 
         Args:
-            article_soup (bs4.BeautifulSoup): BeautifulSoup instance
-        """
-        title = article_soup.find("title")
-        # print(title.text)
-        title1 = title.text.split("—")[0]
-        # print(title1)
-        self.article.title = title1.strip()
-        # print(self.article.title)
-
-        self.article.author = []
-        # author = article_soup.find("p", "strong")
-        author = article_soup.find("p", class_="bio-name")
-        if author is None:
-            author = "NOT FOUND"
-            self.article.author += author
+            article_tree (html.HtmlElement): Root of lxml HTML tree
+        """
+        title = article_tree.findtext(".//title") or ""
+        self.article.title = title.split("—")[0].strip()
+
+        authors = article_tree.xpath(
+            '//p[contains(concat(" ", normalize-space(@class), " "), " bio-name ")]'
+        )
+        if authors:
+            self.article.author = [authors[0].text_content().strip()]
         else:
-            self.article.author += author
-        # author = article_soup.find("span", class_="vcard author")
-        # author = article_soup.find("a", rel="author")
-        # print(author)
-        # print(self.article.author)
+            self.article.author = ["NOT FOUND"]
 
     def unify_date_format(self, date_str: str) -> datetime.datetime:
         """
@@ -355,14 +532,142 @@ class HTMLParser:
             Union[Article, bool, list]: Article instance
         """
         response = make_request(self._full_url, self.config)
-        article_bs = BeautifulSoup(response.text, "html.parser")
+        return self.parse_page(response.content)
+
+    def parse_page(self, page: bytes) -> Article:
+        """
+        Parse already downloaded article page.
+
+        Article fields stay empty if the page has no content.
+
+        Args:
+            page (bytes): Raw article page content
+
+        Returns:
+            Article: Article instance
+        """
+        try:
+            article_tree = html.fromstring(
+                page, parser=html.HTMLParser(encoding=self.config.get_encoding())
+            )
+        except etree.ParserError:
+            return self.article
 
-        self._fill_article_with_text(article_bs)
-        self._fill_article_with_meta_information(article_bs)
+        self._fill_article_with_text(article_tree)
+        self._fill_article_with_meta_information(article_tree)
 
         return self.article
 
 
+def parse_one(full_url: str, article_id: int, config: Config, page: bytes) -> Article:
+    """
+    Parse downloaded article page, suitable for running in a worker process.
+
+    Args:
+        full_url (str): Site url
+        article_id (int): Article id
+        config (Config): Configuration
+        page (bytes): Raw article page content
+
+    Returns:
+        Article: Filled Article instance
+    """
+    return HTMLParser(full_url, article_id, config).parse_page(page)
+
+
+async def _crawl_seed(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    limiters: defaultdict[str, AsyncLimiter],
+    crawler: Crawler,
+    seed_url: str,
+    urls: asyncio.Queue,
+) -> None:
+    """
+    Download seed page and queue article urls found on it.
+
+    Nothing is downloaded once enough article urls are collected.
+    Seed page that fails to download is skipped.
+
+    Args:
+        session (aiohttp.ClientSession): Client session shared by the whole run
+        semaphore (asyncio.Semaphore): Semaphore bounding requests in flight
+        limiters (defaultdict[str, AsyncLimiter]): Rate limiters keyed by host
+        crawler (Crawler): Crawler keeping found urls
+        seed_url (str): Seed url
+        urls (asyncio.Queue): Queue of article ids and urls to parse
+    """
+    if len(crawler.urls) >= crawler.config.get_num_articles():
+        return
+    try:
+        page = await fetch(session, seed_url, semaphore, limiters)
+    except PAGE_ERRORS as error:
+        print(f"Skipping seed {seed_url}: {error!r}")
+        return
+    first_id = len(crawler.urls) + 1
+    for article_id, url in enumerate(crawler.collect_urls(seed_url, page), start=first_id):
+        await urls.put((article_id, url))
+
+
+async def _parse_articles(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    limiters: defaultdict[str, AsyncLimiter],
+    pool: ProcessPoolExecutor,
+    urls: asyncio.Queue,
+    articles: asyncio.Queue,
+    config: Config,
+) -> None:
+    """
+    Download and parse queued articles until None is received.
+
+    Article that fails to download or parse is skipped.
+
+    Args:
+        session (aiohttp.ClientSession): Client session shared by the whole run
+        semaphore (asyncio.Semaphore): Semaphore bounding requests in flight
+        limiters (defaultdict[str, AsyncLimiter]): Rate limiters keyed by host
+        pool (ProcessPoolExecutor): Pool of parsing processes
+        urls (asyncio.Queue): Queue of article ids and urls to parse
+        articles (asyncio.Queue): Queue of parsed articles to save
+        config (Config): Configuration
+    """
+    loop = asyncio.get_running_loop()
+    while (item := await urls.get()) is not None:
+        article_id, full_url = item
+        try:
+            page = await fetch(session, full_url, semaphore, limiters)
+            article = await loop.run_in_executor(
+                pool, parse_one, full_url, article_id, config, page
+            )
+        except PAGE_ERRORS as error:
+            print(f"Skipping article {full_url}: {error!r}")
+            continue
+        await articles.put(article)
+
+
+def _save_article(article: Article) -> None:
+    """
+    Save raw text and meta information of article.
+
+    Args:
+        article (Article): Article instance
+    """
+    article_io.to_raw(article)
+    article_io.to_meta(article)
+
+
+async def _write_articles(articles: asyncio.Queue) -> None:
+    """
+    Save articles from queue one by one until None is received.
+
+    Args:
+        articles (asyncio.Queue): Queue of parsed articles to save
+    """
+    while (article := await articles.get()) is not None:
+        await asyncio.to_thread(_save_article, article)
+
+
 def prepare_environment(base_path: Union[pathlib.Path, str]) -> None:
     """
     Create ASSETS_PATH folder if no created and remove existing folder.
@@ -376,24 +681,64 @@ def prepare_environment(base_path: Union[pathlib.Path, str]) -> None:
     pathlib.Path(base_path).mkdir(parents=True)
 
 
-def main() -> None:
+async def _main() -> None:
     """
-    Entrypoint for scrapper module.
+    Crawl seed urls, download and parse articles as a pipeline.
+
+    Seed pages feed a queue of article urls consumed by parsing workers,
+    pages are parsed in worker processes, and files are written
+    by a single writer task fed through a queue.
     """
-    print("start")
     configuration = Config(CRAWLER_CONFIG_PATH)
     crawler = Crawler(config=configuration)
-    crawler.find_articles()
     prepare_environment(ASSETS_PATH)
 
-    article_id = 1
-    for url in crawler.urls:
-        # print(url)
-        parser = HTMLParser(url, article_id, configuration)
-        parser.parse()
-        article_id += 1
-        article_io.to_raw(parser.article)
-        article_io.to_meta(parser.article)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    limiters = _create_host_limiters()
+    connector = aiohttp.TCPConnector(
+        limit_per_host=MAX_CONCURRENT_REQUESTS, ssl=configuration.get_verify_certificate()
+    )
+    urls: asyncio.Queue = asyncio.Queue()
+    articles: asyncio.Queue = asyncio.Queue()
+    writer = asyncio.create_task(_write_articles(articles))
+    try:
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            async with aiohttp.ClientSession(
+                connector=connector,
+                headers=configuration.get_headers(),
+                timeout=aiohttp.ClientTimeout(total=configuration.get_timeout()),
+            ) as session:
+                workers = [
+                    asyncio.create_task(
+                        _parse_articles(
+                            session, semaphore, limiters, pool, urls, articles, configuration
+                        )
+                    )
+                    for _ in range(MAX_CONCURRENT_REQUESTS)
+                ]
+                try:
+                    for seed_url in crawler.get_search_urls():
+                        await _crawl_seed(session, semaphore, limiters, crawler, seed_url, urls)
+                    for _ in workers:
+                        await urls.put(None)
+                    await asyncio.gather(*workers)
+                finally:
+                    for worker in workers:
+                        worker.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
+    finally:
+        await articles.put(None)
+        await writer
+
+
+def main() -> None:
+    """
+    Entrypoint for scrapper module.
+    """
+    print("start")
+    asyncio.run(_main())
 
 
 if __name__ == "__main__":
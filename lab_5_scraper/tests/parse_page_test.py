@@ -0,0 +1,107 @@
+"""
+Parsing of downloaded article pages validation.
+"""
+
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scraper.scraper import Config, HTMLParser, parse_one
+
+
+class ParsePageTest(unittest.TestCase):
+    """
+    Class for testing HTMLParser.parse_page on stubbed pages.
+    """
+
+    sample_page = """
+<html>
+    <head><title>Заголовок статьи — Вести</title></head>
+    <body>
+        <p class="bio-name">Иван Иванов</p>
+        <p>Первый <b>абзац</b>.</p>
+        <p>Второй абзац.</p>
+    </body>
+</html>
+""".encode("utf-8")
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ParsePageTest class.
+        """
+        self.config = Config(CRAWLER_CONFIG_PATH)
+        self.parser = HTMLParser("http://vzm-vesti.ru/article/", 1, self.config)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_parse_page_fills_article(self) -> None:
+        """
+        Ensure text, title and author are taken from the page.
+        """
+        article = self.parser.parse_page(self.sample_page)
+        self.assertEqual(article.text, "Иван ИвановПервый абзац.Второй абзац.")
+        self.assertEqual(article.title, "Заголовок статьи")
+        self.assertEqual(article.author, ["Иван Иванов"])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_parse_page_finds_author_among_several_classes(self) -> None:
+        """
+        Ensure author paragraph is found when it has other classes too.
+        """
+        page = '<html><body><p class="bio-name  author">Пётр</p>'
+        page += '<p class="bio-names">Не автор</p></body></html>'
+        article = self.parser.parse_page(page.encode("utf-8"))
+        self.assertEqual(article.author, ["Пётр"])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_parse_page_handles_missing_meta(self) -> None:
+        """
+        Ensure page without title and author is parsed with placeholders.
+        """
+        article = self.parser.parse_page(b"<html><body><p>Text</p></body></html>")
+        self.assertEqual(article.text, "Text")
+        self.assertEqual(article.title, "")
+        self.assertEqual(article.author, ["NOT FOUND"])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_parse_page_handles_empty_page(self) -> None:
+        """
+        Ensure empty or whitespace-only page gives article with empty fields.
+        """
+        for page in (b"", b"  \n "):
+            article = HTMLParser("http://vzm-vesti.ru/article/", 1, self.config).parse_page(page)
+            self.assertEqual(article.text, "")
+            self.assertEqual(article.title, "")
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_parse_one_handles_empty_page_in_worker_process(self) -> None:
+        """
+        Ensure empty page parsed in worker process comes back as article.
+        """
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            article = pool.submit(
+                parse_one, "http://vzm-vesti.ru/article/", 1, self.config, b""
+            ).result()
+        self.assertEqual(article.article_id, 1)
+        self.assertEqual(article.text, "")
@@ -0,0 +1,214 @@
+"""
+Offline crawling and scraping pipeline validation.
+"""
+
+# pylint: disable=protected-access
+import asyncio
+import json
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_CRAWLER_CONFIG_PATH, TEST_PATH
+from core_utils.article import article
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scraper import scraper
+from lab_5_scraper.scraper import Config, Crawler
+from lab_5_scraper.tests.config_generator import generate_config
+from lab_5_scraper.tests.utils import LocalSite
+
+
+def seed_page(*hrefs: str) -> bytes:
+    """
+    Build seed page listing article links in a single header.
+
+    Args:
+        *hrefs (str): Article links
+
+    Returns:
+        bytes: Raw seed page content
+    """
+    links = "".join(f'<a href="{href}">Статья</a>' for href in hrefs)
+    return f'<html><body><h2 class="post-title entry-title">{links}</h2></body></html>'.encode()
+
+
+def article_page(title: str) -> bytes:
+    """
+    Build article page.
+
+    Args:
+        title (str): Article title
+
+    Returns:
+        bytes: Raw article page content
+    """
+    return (
+        f"<html><head><title>{title} — Вести</title></head>"
+        f'<body><p class="bio-name">Автор</p><p>Текст {title}.</p></body></html>'
+    ).encode()
+
+
+class CollectUrlsTest(unittest.TestCase):
+    """
+    Class for testing Crawler.collect_urls on stubbed seed pages.
+    """
+
+    seed_url = "http://vzm-vesti.ru/category/news/"
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CollectUrlsTest class.
+        """
+        self.config = Config(CRAWLER_CONFIG_PATH)
+        self.config._num_articles = 3
+        self.crawler = Crawler(self.config)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_collect_urls_resolves_and_deduplicates(self) -> None:
+        """
+        Ensure relative links are resolved and the same page is stored once.
+        """
+        page = seed_page("/a/", "http://VZM-vesti.ru/a/#comments", "b/")
+        new_urls = self.crawler.collect_urls(self.seed_url, page)
+        expected = ["http://vzm-vesti.ru/a/", "http://vzm-vesti.ru/category/news/b/"]
+        self.assertEqual(new_urls, expected)
+        self.assertEqual(self.crawler.urls, expected)
+        self.assertEqual(self.crawler.collect_urls(self.seed_url, page), [])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_collect_urls_respects_number_of_articles(self) -> None:
+        """
+        Ensure no more urls than requested are collected.
+        """
+        self.crawler.collect_urls(self.seed_url, seed_page("/1/", "/2/", "/3/", "/4/"))
+        self.assertEqual(len(self.crawler.urls), 3)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_collect_urls_skips_malformed_links(self) -> None:
+        """
+        Ensure link with malformed port is skipped.
+        """
+        new_urls = self.crawler.collect_urls(
+            self.seed_url, seed_page("http://vzm-vesti.ru:abc/x", "/ok/")
+        )
+        self.assertEqual(new_urls, ["http://vzm-vesti.ru/ok/"])
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_collect_urls_handles_page_without_articles(self) -> None:
+        """
+        Ensure page without article headers gives no urls.
+        """
+        self.assertEqual(self.crawler.collect_urls(self.seed_url, b"<html></html>"), [])
+
+
+class PipelineTest(unittest.TestCase):
+    """
+    Class for testing the whole scraping pipeline against a local site.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for PipelineTest class.
+        """
+        self.site = LocalSite(
+            {
+                "/seed": [
+                    (200, {}, seed_page("/1", "/2", "http://127.0.0.1:1/unreachable", "/empty"))
+                ],
+                "/1": [(200, {}, article_page("Первая"))],
+                "/2": [(200, {}, article_page("Вторая"))],
+                "/empty": [(200, {}, b"")],
+            }
+        )
+        self.site.start()
+
+        with CRAWLER_CONFIG_PATH.open(encoding="utf-8") as file:
+            reference = json.load(file)
+        generate_config(
+            seed_urls=[self.site.url("/seed")],
+            num_articles=4,
+            headers=reference["headers"],
+            encoding=reference["encoding"],
+            timeout=5,
+            should_verify_certificate=False,
+            headless_mode=reference["headless_mode"],
+        )
+        self.assets_path = TEST_PATH / "articles"
+        self.patches = [
+            mock.patch.object(scraper, "CRAWLER_CONFIG_PATH", TEST_CRAWLER_CONFIG_PATH),
+            mock.patch.object(scraper, "SEED_URL_PREFIXES", ("http://127.0.0.1",)),
+            mock.patch.object(scraper, "HOST_REQUEST_INTERVAL", 0.01),
+            mock.patch.object(scraper, "ASSETS_PATH", self.assets_path),
+            mock.patch.object(article, "ASSETS_PATH", self.assets_path),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_pipeline_saves_articles_skipping_failed_ones(self) -> None:
+        """
+        Ensure unreachable article is skipped while all others are saved.
+        """
+        asyncio.run(scraper._main())
+
+        saved = sorted(path.name for path in self.assets_path.iterdir())
+        expected = ["1_meta.json", "1_raw.txt", "2_meta.json", "2_raw.txt"]
+        expected += ["4_meta.json", "4_raw.txt"]
+        self.assertEqual(saved, expected)
+        self.assertEqual(
+            (self.assets_path / "2_raw.txt").read_text(encoding="utf-8"), "АвторТекст Вторая."
+        )
+        self.assertEqual((self.assets_path / "4_raw.txt").read_text(encoding="utf-8"), "")
+        with (self.assets_path / "1_meta.json").open(encoding="utf-8") as file:
+            meta = json.load(file)
+        self.assertEqual(meta["title"], "Первая")
+        self.assertEqual(meta["url"], self.site.url("/1"))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_pipeline_survives_unavailable_seed(self) -> None:
+        """
+        Ensure unavailable seed page does not prevent other seeds from being scraped.
+        """
+        config = json.loads(TEST_CRAWLER_CONFIG_PATH.read_text(encoding="utf-8"))
+        config["seed_urls"] = ["http://127.0.0.1:1/seed", self.site.url("/seed")]
+        TEST_CRAWLER_CONFIG_PATH.write_text(json.dumps(config), encoding="utf-8")
+
+        asyncio.run(scraper._main())
+
+        self.assertTrue((self.assets_path / "1_raw.txt").exists())
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for PipelineTest class.
+        """
+        for patch in reversed(self.patches):
+            patch.stop()
+        self.site.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
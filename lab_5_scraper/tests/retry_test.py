@@ -0,0 +1,179 @@
+"""
+Request retries validation.
+"""
+
+# pylint: disable=protected-access
+import asyncio
+import unittest
+from unittest import mock
+
+import aiohttp
+import pytest
+
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scraper import scraper
+from lab_5_scraper.scraper import (
+    MAX_RETRIES,
+    MAX_RETRY_DELAY,
+    Config,
+    _create_host_limiters,
+    _get_retry_delay,
+    fetch,
+    make_request,
+)
+from lab_5_scraper.tests.utils import LocalSite
+
+
+class RetryDelayTest(unittest.TestCase):
+    """
+    Class for testing delay before repeating a request.
+    """
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_retry_delay_follows_retry_after(self) -> None:
+        """
+        Ensure Retry-After given in seconds is respected.
+        """
+        self.assertEqual(_get_retry_delay("5", 0), 5.0)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_retry_delay_backs_off_exponentially(self) -> None:
+        """
+        Ensure delay grows with attempts when Retry-After is missing or not in seconds.
+        """
+        self.assertLess(_get_retry_delay(None, 0), _get_retry_delay(None, 1))
+        self.assertEqual(
+            _get_retry_delay("Wed, 21 Oct 2015 07:28:00 GMT", 1), _get_retry_delay(None, 1)
+        )
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_retry_delay_is_capped(self) -> None:
+        """
+        Ensure delay never exceeds MAX_RETRY_DELAY.
+        """
+        self.assertEqual(_get_retry_delay("86400", 0), MAX_RETRY_DELAY)
+        self.assertEqual(_get_retry_delay(None, 20), MAX_RETRY_DELAY)
+
+
+class RetryRequestTest(unittest.TestCase):
+    """
+    Class for testing repeated requests against a local site.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for RetryRequestTest class.
+        """
+        unavailable = (503, {"Retry-After": "0"}, b"busy")
+        self.site = LocalSite(
+            {
+                "/flaky": [unavailable, (200, {}, b"ok")],
+                "/down": [unavailable],
+                "/missing": [(404, {}, b"")],
+            }
+        )
+        self.site.start()
+        self.config = Config(CRAWLER_CONFIG_PATH)
+        self.interval_patch = mock.patch.object(scraper, "HOST_REQUEST_INTERVAL", 0.01)
+        self.interval_patch.start()
+
+    def _fetch(self, path: str) -> bytes:
+        """
+        Fetch page of local site with a fresh client session.
+
+        Args:
+            path (str): Path of the page
+
+        Returns:
+            bytes: Raw page content
+        """
+
+        async def run() -> bytes:
+            async with aiohttp.ClientSession() as session:
+                return await fetch(
+                    session, self.site.url(path), asyncio.Semaphore(1), _create_host_limiters()
+                )
+
+        return asyncio.run(run())
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_make_request_retries_unavailable_page(self) -> None:
+        """
+        Ensure make_request repeats request answered with retryable status.
+        """
+        response = make_request(self.site.url("/flaky"), self.config)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.site.requests_count["/flaky"], 2)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_make_request_gives_up_after_max_retries(self) -> None:
+        """
+        Ensure make_request stops after MAX_RETRIES repeated requests.
+        """
+        response = make_request(self.site.url("/down"), self.config)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.site.requests_count["/down"], MAX_RETRIES + 1)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_make_request_does_not_retry_missing_page(self) -> None:
+        """
+        Ensure make_request does not repeat request answered with non-retryable status.
+        """
+        response = make_request(self.site.url("/missing"), self.config)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.site.requests_count["/missing"], 1)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_fetch_retries_unavailable_page(self) -> None:
+        """
+        Ensure fetch repeats request answered with retryable status.
+        """
+        self.assertEqual(self._fetch("/flaky"), b"ok")
+        self.assertEqual(self.site.requests_count["/flaky"], 2)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.lab_5_scraper
+    def test_fetch_gives_up_after_max_retries(self) -> None:
+        """
+        Ensure fetch stops after MAX_RETRIES repeated requests.
+        """
+        self.assertEqual(self._fetch("/down"), b"busy")
+        self.assertEqual(self.site.requests_count["/down"], MAX_RETRIES + 1)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for RetryRequestTest class.
+        """
+        self.interval_patch.stop()
+        self.site.stop()
@@ -5,6 +5,8 @@ Utils for lab_5_scraper tests.
 # pylint: disable=no-member,assignment-from-no-return
 
 import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 from admin_utils.test_params import TEST_PATH
 from core_utils.article import article
@@ -32,3 +34,78 @@ def scraper_setup() -> None:
         return_value = parser.parse()
         to_raw(return_value)
         to_meta(return_value)
+
+
+class LocalSite:
+    """
+    Local HTTP server answering with prepared responses.
+    """
+
+    def __init__(self, responses: dict[str, list[tuple[int, dict[str, str], bytes]]]) -> None:
+        """
+        Initialize an instance of the LocalSite class.
+
+        Args:
+            responses (dict[str, list[tuple[int, dict[str, str], bytes]]]): Status, headers
+                and body to answer with, consumed one per request for each path,
+                the last one is repeated
+        """
+        self.responses = responses
+        self.requests_count: dict[str, int] = {}
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Handler answering with prepared responses.
+            """
+
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                """
+                Answer GET request.
+                """
+                count = site.requests_count.get(self.path, 0)
+                site.requests_count[self.path] = count + 1
+                path_responses = site.responses.get(self.path, [(404, {}, b"")])
+                status, headers, body = path_responses[min(count, len(path_responses) - 1)]
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                """
+                Silence request logging.
+
+                Args:
+                    *args (object): Message arguments
+                """
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        """
+        Build absolute url of path on the local site.
+
+        Args:
+            path (str): Path starting with a slash
+
+        Returns:
+            str: Absolute url
+        """
+        return f"http://127.0.0.1:{self._server.server_address[1]}{path}"
+
+    def start(self) -> None:
+        """
+        Start serving requests in background thread.
+        """
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop serving requests.
+        """
+        self._server.shutdown()
+        self._server.server_close()